@@ -29,14 +29,19 @@ Supports compressed files:
 
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import re
 import gzip
+import io
+import mmap
 import tempfile
 import math
 import platform
 import sys
+import threading
+import traceback
+import numpy as np  # For raw byte buffers - install with: pip install numpy
 import psutil  # For detailed system specs - install with: pip install psutil
 
 # Try to import hatanaka library for CRX file support
@@ -46,6 +51,347 @@ try:
 except ImportError:
     HATANAKA_AVAILABLE = False
 
+# Try to import numba to compile the observation scanner to machine code
+# (optional - without it a plain Python loop is used, which is slower on big files)
+try:
+    from numba import njit as numba_njit
+    NUMBA_AVAILABLE = True
+    
+    def njit(**options):
+        # numba.njit, falling back to no on-disk cache when numba can't find a place
+        # for it - e.g. in a PyInstaller build, where the source file isn't on disk
+        def decorate(func):
+            try:
+                return numba_njit(**options)(func)
+            except RuntimeError:
+                return numba_njit(**{**options, 'cache': False})(func)
+        return decorate
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        # Stand-in for numba.njit that leaves the function as plain Python
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# RINEX headers are 60 chars of data + 20 chars of label = 80 chars total.
+# Header labels we extract (ANTENNA TYPE / ANTENNA DELTA are written by some older tools)
+LABEL_VERSION = b"RINEX VERSION / TYPE"
+LABEL_MARKER_NAME = b"MARKER NAME"
+LABEL_MARKER_NUMBER = b"MARKER NUMBER"
+LABEL_MARKER_TYPE = b"MARKER TYPE"
+LABEL_OBSERVER_AGENCY = b"OBSERVER / AGENCY"
+LABEL_RECEIVER = b"REC # / TYPE / VERS"
+LABEL_ANTENNA = b"ANT # / TYPE"
+LABEL_ANTENNA_OLD = b"ANTENNA TYPE"
+LABEL_ANTENNA_DELTA = b"ANTENNA: DELTA H/E/N"
+LABEL_ANTENNA_DELTA_OLD = b"ANTENNA DELTA"
+LABEL_APPROX_POSITION = b"APPROX POSITION XYZ"
+LABEL_INTERVAL = b"INTERVAL"
+LABEL_TIME_FIRST_OBS = b"TIME OF FIRST OBS"
+LABEL_TIME_LAST_OBS = b"TIME OF LAST OBS"
+LABEL_LEAP_SECONDS = b"LEAP SECONDS"
+LABEL_SYS_OBS_TYPES = b"SYS / # / OBS TYPES"
+LABEL_TYPES_OF_OBSERV = b"# / TYPES OF OBSERV"
+LABEL_END_OF_HEADER = b"END OF HEADER"
+
+# Hatanaka compressed RINEX 2 file names end in .##d (e.g. site1230.24d)
+CRX_D_RE = re.compile(r'\.\d{2}d$')
+
+# File extension -> (is_compressed, compression_type, needs_hatanaka)
+# .gz and .##d need an extra look at the name, see detect_file_type
+SUFFIX_TABLE = {
+    '.crx': (True, 'hatanaka', True),
+    '.z': (True, 'compress', True),
+    '.bz2': (True, 'bzip2', True),
+    '.zip': (True, 'zip', True),
+}
+
+# Read-ahead size for file and gzip streams - 128 KiB reads keep zlib busy
+# without holding large parts of the file in memory
+READ_BUFFER_SIZE = 131072
+
+# Decompressed Hatanaka data larger than this is spooled to a temp file on disk
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Satellite system code -> constellation name, in the order the report lists them
+CONSTELLATION_NAMES = {
+    'G': 'GPS',
+    'R': 'GLONASS',
+    'E': 'Galileo',
+    'C': 'BeiDou',
+    'J': 'QZSS',
+    'I': 'IRNSS/NavIC',
+    'S': 'SBAS',
+    'ALL': 'All Systems'
+}
+
+# Same as above plus the mixed-file code used in the RINEX version line
+SYSTEM_NAMES = {**CONSTELLATION_NAMES, 'M': 'Mixed'}
+
+# Fixed section banners of the analysis report
+REPORT_RULE = "=" * 80 + "\n"
+BANNER_FILE_INFO = f"{REPORT_RULE}RINEX FILE INFORMATION\n{REPORT_RULE}\n"
+BANNER_SURVEY = f"{REPORT_RULE}SURVEY METADATA\n{REPORT_RULE}"
+BANNER_QUALITY = f"{REPORT_RULE}DATA QUALITY INDICATORS\n{REPORT_RULE}\n"
+BANNER_ADDITIONAL = f"{REPORT_RULE}ADDITIONAL INFORMATION\n{REPORT_RULE}\n"
+BANNER_COMPRESSION = f"{REPORT_RULE}COMPRESSION SUPPORT STATUS\n{REPORT_RULE}"
+
+# Compression support line of the report - HATANAKA_AVAILABLE can't change after import
+if HATANAKA_AVAILABLE:
+    COMPRESSION_STATUS = (
+        "✓ Hatanaka library installed - CRX files supported\n"
+        "  Supported: .crx, .##d, .gz, .Z, .bz2, .zip\n"
+    )
+else:
+    COMPRESSION_STATUS = (
+        "✗ Hatanaka library NOT installed\n"
+        "  Limited support: only .gz files (gzip) are supported\n"
+        "  To enable CRX support, install: pip install hatanaka\n"
+    )
+
+# Epoch times are stored as int64 microseconds since this reference time
+UNIX_EPOCH = datetime(1970, 1, 1)
+
+# Initial size of the epoch time array (doubled whenever it fills up)
+EPOCH_ARRAY_START = 4096
+
+# Shortest line the scanners can count as an epoch ("> 1 1 1 1 1 1" plus newline),
+# used to size the epoch time array before each block
+MIN_EPOCH_LINE = 14
+
+# Layout of the state array shared between successive _scan_observations calls
+SCAN_IN_EPOCH = 0      # 1 once an epoch line has been seen
+SCAN_EPOCH_COUNT = 1   # Number of epoch lines
+SCAN_CONST_MASK = 2    # Bit (code - ord('A')) set for each satellite system seen
+SCAN_NUM_TIMES = 3     # Number of entries filled in the epoch time array
+SCAN_STATE_SIZE = 4
+
+
+@njit(cache=True, nogil=True)
+def _is_space(c):
+    # Same characters bytes.split() / bytes.strip() treat as whitespace
+    return c == 32 or (9 <= c <= 13)
+
+
+@njit(cache=True, nogil=True)
+def _parse_uint(buf, start, stop):
+    # Integer value of buf[start:stop] with surrounding whitespace ignored, -1 if not a number
+    while start < stop and _is_space(buf[start]):
+        start += 1
+    while stop > start and _is_space(buf[stop - 1]):
+        stop -= 1
+    if start == stop:
+        return -1
+    value = 0
+    for i in range(start, stop):
+        c = buf[i]
+        if c < 48 or c > 57:
+            return -1
+        value = value * 10 + (c - 48)
+    return value
+
+
+@njit(cache=True, nogil=True)
+def _parse_seconds_us(buf, start, stop):
+    # Seconds field (e.g. " 30.0000000") in microseconds, -1 if not a number
+    while start < stop and _is_space(buf[start]):
+        start += 1
+    while stop > start and _is_space(buf[stop - 1]):
+        stop -= 1
+    whole = 0
+    frac = 0.0
+    scale = 1.0
+    digits = 0
+    seen_dot = False
+    for i in range(start, stop):
+        c = buf[i]
+        if c == 46 and not seen_dot:
+            seen_dot = True
+        elif 48 <= c <= 57:
+            digits += 1
+            if seen_dot:
+                scale *= 0.1
+                frac += (c - 48) * scale
+            else:
+                whole = whole * 10 + (c - 48)
+        else:
+            return -1
+    if digits == 0:
+        return -1
+    return whole * 1_000_000 + round(frac * 1_000_000)
+
+
+@njit(cache=True, nogil=True)
+def _epoch_us(year, month, day, hour, minute, second_us):
+    # Microseconds since 1970-01-01 for a calendar date/time, -1 if the date is invalid
+    if year < 1 or year > 9999 or month < 1 or month > 12 or day < 1:
+        return -1
+    if hour < 0 or hour > 23 or minute < 0 or minute > 59:
+        return -1
+    if second_us < 0 or second_us >= 60_000_000:
+        return -1
+    if month == 2:
+        leap = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+        days_in_month = 29 if leap else 28
+    elif month == 4 or month == 6 or month == 9 or month == 11:
+        days_in_month = 30
+    else:
+        days_in_month = 31
+    if day > days_in_month:
+        return -1
+    # Days since 1970-01-01 (Howard Hinnant's days_from_civil)
+    y = year - 1 if month <= 2 else year
+    era = y // 400
+    yoe = y - era * 400
+    mp = month - 3 if month > 2 else month + 9
+    doy = (153 * mp + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    days = era * 146097 + doe - 719468
+    return ((days * 24 + hour) * 60 + minute) * 60_000_000 + second_us
+
+
+@njit(cache=True, nogil=True)
+def _record_epoch(state, epoch_times, t):
+    n = state[SCAN_NUM_TIMES]
+    if n < epoch_times.shape[0]:
+        epoch_times[n] = t
+        state[SCAN_NUM_TIMES] = n + 1
+
+
+@njit(cache=True, nogil=True)
+def _scan_observations(buf, state, epoch_times):
+    """
+    Scan a block of RINEX observation records for epochs and satellite systems.
+    buf holds whole lines as uint8; results accumulate in state (see SCAN_* layout)
+    and epoch_times, so a file can be fed through in consecutive blocks.
+    Applies the same rules as the line-by-line loop in parse_observation_data.
+    """
+    n = buf.shape[0]
+    # Field positions of the current RINEX 3.x epoch line
+    starts = np.empty(7, dtype=np.int64)
+    stops = np.empty(7, dtype=np.int64)
+    i = 0
+    while i < n:
+        # Find the end of this line; line_len counts the newline like len(line) does
+        j = i
+        while j < n and buf[j] != 10:
+            j += 1
+        line_len = j - i + 1 if j < n else j - i
+        
+        # RINEX 3.x epoch line: > YYYY MM DD HH MM SS.SSSSSSS
+        if line_len > 0 and buf[i] == 62:
+            state[SCAN_IN_EPOCH] = 1
+            state[SCAN_EPOCH_COUNT] += 1
+            # Split the line into whitespace separated fields, keep the first seven
+            fields = 0
+            k = i
+            while k < j and fields < 7:
+                while k < j and _is_space(buf[k]):
+                    k += 1
+                if k == j:
+                    break
+                starts[fields] = k
+                while k < j and not _is_space(buf[k]):
+                    k += 1
+                stops[fields] = k
+                fields += 1
+            if fields == 7:
+                t = _epoch_us(_parse_uint(buf, starts[1], stops[1]),
+                              _parse_uint(buf, starts[2], stops[2]),
+                              _parse_uint(buf, starts[3], stops[3]),
+                              _parse_uint(buf, starts[4], stops[4]),
+                              _parse_uint(buf, starts[5], stops[5]),
+                              _parse_seconds_us(buf, starts[6], stops[6]))
+                if t != -1:
+                    _record_epoch(state, epoch_times, t)
+        
+        # RINEX 2.x epoch line: space, then YY MM DD HH MM SS.SSSSSSS in fixed columns
+        elif (line_len > 29 and buf[i] == 32
+              and 48 <= buf[i + 1] <= 57 and 48 <= buf[i + 2] <= 57):
+            year = _parse_uint(buf, i + 1, i + 3)
+            year = year + 1900 if year >= 80 else year + 2000
+            t = _epoch_us(year,
+                          _parse_uint(buf, i + 4, i + 6),
+                          _parse_uint(buf, i + 7, i + 9),
+                          _parse_uint(buf, i + 10, i + 12),
+                          _parse_uint(buf, i + 13, i + 15),
+                          _parse_seconds_us(buf, i + 16, i + 26))
+            if t != -1:
+                state[SCAN_EPOCH_COUNT] += 1
+                _record_epoch(state, epoch_times, t)
+                state[SCAN_IN_EPOCH] = 1
+        
+        # Observation line - satellite ID (e.g. G01) in the first three columns
+        elif state[SCAN_IN_EPOCH] == 1 and line_len > 3:
+            a = i
+            b = i + 3
+            while a < b and _is_space(buf[a]):
+                a += 1
+            while b > a and _is_space(buf[b - 1]):
+                b -= 1
+            c = buf[a]
+            if b - a >= 2 and ((65 <= c <= 90) or (97 <= c <= 122)):
+                state[SCAN_CONST_MASK] |= 1 << (c - 65)
+        
+        i = j + 1
+
+
+@njit(cache=True, fastmath=True)
+def ecef_to_geodetic(x, y, z):
+    """
+    Convert ECEF XYZ coordinates (meters) to WGS84 latitude, longitude (degrees)
+    and ellipsoidal height (meters).
+    Uses Heikkinen's closed-form solution, so no iteration is needed.
+    """
+    # WGS84 ellipsoid parameters
+    a = 6378137.0  # Semi-major axis in meters
+    f = 1 / 298.257223563  # Flattening
+    b = a * (1 - f)  # Semi-minor axis in meters
+    e2 = f * (2 - f)  # Square of first eccentricity
+    ep2 = e2 / (1 - e2)  # Square of second eccentricity
+    
+    # Longitude (easy part)
+    lon = math.atan2(y, x)
+    
+    # Latitude and height (Heikkinen 1982)
+    r2 = x * x + y * y
+    r = math.sqrt(r2)
+    z2 = z * z
+    E2 = a * a - b * b
+    F = 54.0 * b * b * z2
+    G = r2 + (1 - e2) * z2 - e2 * E2
+    c = e2 * e2 * F * r2 / (G * G * G)
+    s = (1 + c + math.sqrt(c * c + 2 * c)) ** (1.0 / 3.0)
+    k = s + 1 / s + 1
+    P = F / (3 * k * k * G * G)
+    Q = math.sqrt(1 + 2 * e2 * e2 * P)
+    # Rounding can push the radicand a hair below zero right at the poles
+    radicand = 0.5 * a * a * (1 + 1 / Q) - P * (1 - e2) * z2 / (Q * (1 + Q)) - 0.5 * P * r2
+    r0 = -(P * e2 * r) / (1 + Q) + math.sqrt(max(radicand, 0.0))
+    t = r - e2 * r0
+    U = math.sqrt(t * t + z2)
+    V = math.sqrt(t * t + (1 - e2) * z2)
+    z0 = b * b * z / (a * V)
+    
+    elev = U * (1 - b * b / (a * V))
+    lat = math.atan2(z + ep2 * z0, r)
+    
+    # Convert to degrees
+    return math.degrees(lat), math.degrees(lon), elev
+
+
+def _warmup_numba():
+    """
+    Call each compiled function once with dummy data so numba compiles it
+    (or loads it from its on-disk cache) before the user opens a file.
+    """
+    ecef_to_geodetic(6378137.0, 0.0, 0.0)
+    buf = np.frombuffer(b"> 2000 01 01 00 00  0.0000000  0  1\nG01\n", dtype=np.uint8)
+    _scan_observations(buf, np.zeros(SCAN_STATE_SIZE, dtype=np.int64), np.empty(2, dtype=np.int64))
+
+
 class RINEXExaminer:
     """
     Main class that handles the GUI and RINEX file parsing.
@@ -64,6 +410,10 @@ class RINEXExaminer:
         # Create the GUI components (buttons, text areas, etc.)
         self.create_widgets()
         
+        # Compile the numba functions in the background while the user picks a file
+        if NUMBA_AVAILABLE:
+            threading.Thread(target=_warmup_numba, daemon=True).start()
+        
         # Display system information on startup - helps users verify their environment
         self.display_system_info()
         
@@ -99,6 +449,16 @@ class RINEXExaminer:
         )
         self.select_button.pack()
         
+        # Checkbox to read only the header - skips the (possibly huge) observation data
+        self.header_only = tk.BooleanVar(value=False)
+        self.header_only_check = tk.Checkbutton(
+            file_frame,
+            text="Header only (faster for large files)",
+            variable=self.header_only,
+            font=("Arial", 10)
+        )
+        self.header_only_check.pack(pady=(5, 0))
+        
         # Label to show which file is currently loaded
         self.file_label = tk.Label(
             self.root,
@@ -189,9 +549,10 @@ class RINEXExaminer:
         # Gather system specifications
         specs = self.get_system_specs()
         
-        # Build the info text with all relevant details
+        # Build the info text with all relevant details as a list of pieces,
+        # joined once when it goes into the panel
         
-        info_text = f"""
+        parts = [f"""
 {'='*80}
 READY FOR RINEX FILE ANALYSIS
 {'='*80}
@@ -213,9 +574,9 @@ This tool will extract:
   7. Survey metadata (marker, observer, receiver info)
   8. Data quality indicators
 
-"""
+"""]
 
-        info_text += f"""
+        parts.append(f"""
 {'='*80}
 RINEX FILE EXAMINER
 {'='*80}
@@ -266,12 +627,12 @@ Hardware Specifications:
 {'='*80}
 COMPRESSION SUPPORT STATUS
 {'='*80}
-"""
+""")
         
         # Check which compression libraries are available
         # This is critical info - users need to know if they can process compressed files
         if HATANAKA_AVAILABLE:
-            info_text += f"""
+            parts.append(f"""
 ✓ Hatanaka library: INSTALLED
   Supported formats:
     • Hatanaka compressed RINEX (.crx, .##d)
@@ -283,9 +644,9 @@ COMPRESSION SUPPORT STATUS
   Status: Full compression support enabled
 
 {'='*80}
-"""
+""")
         else:
-            info_text += f"""
+            parts.append(f"""
 ✗ Hatanaka library: NOT INSTALLED
   Limited support:
     • Gzip compressed (.gz) - SUPPORTED (built-in)
@@ -303,10 +664,10 @@ COMPRESSION SUPPORT STATUS
   without hatanaka support. Most data providers use Hatanaka compression.
 
 {'='*80} 
-"""
+""")
         
         # Insert the formatted text into the results display area
-        self.results_text.insert(tk.END, info_text)
+        self.results_text.insert(tk.END, "".join(parts))
         
         # Scroll to the top so user sees the start of the message
         self.results_text.see("1.0")
@@ -332,47 +693,61 @@ COMPRESSION SUPPORT STATUS
             self.file_label.config(text=f"File: {os.path.basename(filename)}")
             self.process_rinex_file(filename)
     
-    def detect_file_type(self, filepath):
+    @staticmethod
+    def detect_file_type(filepath):
         """
         Detect if file is compressed and what type.
         Returns: (is_compressed, compression_type, needs_hatanaka)
         """
         filename = filepath.lower()
+        root, ext = os.path.splitext(filename)
         
-        # Check for Hatanaka compression (.crx or .##d format)
-        if filename.endswith('.crx') or re.search(r'\.\d{2}d$', filename):
-            return (True, 'hatanaka', True)
+        # Hatanaka (.crx) and the compressions that need hatanaka
+        if ext in SUFFIX_TABLE:
+            return SUFFIX_TABLE[ext]
         
         # Check for gzip (can handle without hatanaka)
-        if filename.endswith('.gz'):
-            # Could be .crx.gz (needs hatanaka) or .rnx.gz (just gzip)
-            if '.crx.gz' in filename or re.search(r'\.\d{2}d\.gz$', filename):
+        if ext == '.gz':
+            # Could be .crx.gz / .##d.gz (needs hatanaka) or .rnx.gz (just gzip)
+            if root.endswith('.crx') or CRX_D_RE.search(root):
                 return (True, 'hatanaka+gz', True)
             return (True, 'gzip', False)
         
-        # Check for other compressions that need hatanaka
-        if filename.endswith('.z'):
-            return (True, 'compress', True)
-        if filename.endswith('.bz2'):
-            return (True, 'bzip2', True)
-        if filename.endswith('.zip'):
-            return (True, 'zip', True)
+        # Check for Hatanaka compression in .##d format
+        if CRX_D_RE.search(ext):
+            return (True, 'hatanaka', True)
         
         return (False, 'none', False)
     
-    def decompress_file(self, filepath):
+    def decompress_file(self, filepath, file_type, header_only=False):
         """
-        Decompress a compressed RINEX file and return the lines.
+        Open a RINEX file for reading, decompressing it if needed.
         Handles various compression formats using hatanaka library or built-in gzip.
         
-        Returns: List of lines from decompressed file, or None if error
+        file_type: (is_compressed, compression_type, needs_hatanaka) from detect_file_type
+        header_only: Only the header will be read, so Hatanaka decompression can be skipped
+        Returns: Binary file object (an mmap for uncompressed files) holding the
+                 decompressed data, or None if error
         """
-        is_compressed, comp_type, needs_hatanaka = self.detect_file_type(filepath)
+        is_compressed, comp_type, needs_hatanaka = file_type
+        
+        # A Hatanaka (CRX) file stores the RINEX header as plain text right after its
+        # two CRINEX lines - only the observation records are compressed. So when we
+        # just want the header we can read it directly, without running crx2rnx.
+        if header_only and comp_type == 'hatanaka':
+            is_compressed = False
+        elif header_only and comp_type == 'hatanaka+gz':
+            needs_hatanaka = False  # Only the gzip layer has to be undone
         
         if not is_compressed:
-            # Not compressed, read normally
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.readlines()
+            # Not compressed - map it into memory so the OS pages it in on demand
+            # and the scanner can work on the file bytes without copying them
+            with open(filepath, 'rb') as f:
+                try:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    pass  # Empty files (and some special files) can't be mapped
+            return open(filepath, 'rb', buffering=READ_BUFFER_SIZE)
         
         # File is compressed
         if needs_hatanaka:
@@ -388,10 +763,12 @@ COMPRESSION SUPPORT STATUS
             
             # Use hatanaka library to decompress
             try:
-                # Decompress to string
-                decompressed_data = decompress(filepath)
-                # Split into lines
-                return decompressed_data.decode('utf-8', errors='ignore').split('\n')
+                # hatanaka only decompresses whole files, so park the result in a
+                # spooled temp file and stream from there like any other file
+                stream = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+                stream.write(decompress(filepath))
+                stream.seek(0)
+                return stream
             except Exception as e:
                 messagebox.showerror("Decompression Error", f"Failed to decompress file:\n{str(e)}")
                 return None
@@ -399,8 +776,10 @@ COMPRESSION SUPPORT STATUS
         else:
             # Just gzip, can handle with built-in library
             try:
-                with gzip.open(filepath, 'rt', encoding='utf-8', errors='ignore') as f:
-                    return f.readlines()
+                stream = io.BufferedReader(gzip.open(filepath, 'rb'), buffer_size=READ_BUFFER_SIZE)
+                # Decompress the first block now so a corrupt archive is reported here
+                stream.peek(1)
+                return stream
             except Exception as e:
                 messagebox.showerror("Decompression Error", f"Failed to decompress gzip file:\n{str(e)}")
                 return None
@@ -413,36 +792,42 @@ COMPRESSION SUPPORT STATUS
         """
         
         try:
-            # Decompress file if needed and get lines
-            lines = self.decompress_file(filepath)
+            # Work out the compression once - both opening and reporting need it
+            file_type = self.detect_file_type(filepath)
             
-            if lines is None:
+            # Decompress file if needed and get a stream of its lines
+            header_only = self.header_only.get()
+            stream = self.decompress_file(filepath, file_type, header_only)
+            
+            if stream is None:
                 # Error already shown in decompress_file
                 return
             
-            # Parse the header and observation data
-            header_data = self.parse_rinex_header(lines)
-            obs_data = self.parse_observation_data(lines, header_data)
+            # Parse the header and observation data - the header parser stops at
+            # "END OF HEADER" and the observation parser picks up from there
+            with stream:
+                header_data, header_end = self.parse_rinex_header(stream)
+                obs_data = self.parse_observation_data(stream, header_data, header_end, header_only)
             
             # Combine header and observation data
             all_data = {**header_data, **obs_data}
             
             # Display the extracted information
-            self.display_results(all_data, filepath)
+            self.display_results(all_data, filepath, file_type)
             
         except Exception as e:
             # If something goes wrong, show error message
             messagebox.showerror("Error", f"Error reading file:\n{str(e)}")
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, f"Error: {str(e)}")
+            self.show_results([f"Error: {str(e)}"])
     
-    def parse_rinex_header(self, lines):
+    def parse_rinex_header(self, stream):
         """
         Parse the RINEX header section to extract metadata.
         RINEX files have a header section at the top with labels ending in specific keywords.
         
-        lines: List of all lines from the RINEX file
-        Returns: Dictionary with extracted header information
+        stream: Binary file object positioned at the start of the RINEX file.
+                Reading stops right after the "END OF HEADER" line.
+        Returns: (header dictionary, byte offset where the observation data starts)
         """
         
         data = {
@@ -452,7 +837,7 @@ COMPRESSION SUPPORT STATUS
             'observation_types': {},
             'antenna_type': 'Unknown',
             'antenna_height': 'Unknown',
-            'antenna_delta': 'Unknown',
+            'antenna_delta': None,
             'approx_position': 'Unknown',
             'lat_lon_elev': 'Not calculated',
             'interval': 'Unknown',
@@ -461,175 +846,202 @@ COMPRESSION SUPPORT STATUS
             'leap_seconds': 'Unknown',
             'constellations_obs': set(),
             'constellations_nav': set(),
-            # Survey-critical additions
-            'marker_name': 'Unknown',
-            'marker_number': 'Unknown',
-            'marker_type': 'Unknown',
-            'observer': 'Unknown',
-            'agency': 'Unknown',
-            'receiver_number': 'Unknown',
-            'receiver_type': 'Unknown',
-            'receiver_version': 'Unknown',
-            'antenna_number': 'Unknown',
+            # Survey-critical additions - None until found in the header
+            'marker_name': None,
+            'marker_number': None,
+            'marker_type': None,
+            'observer': None,
+            'agency': None,
+            'receiver_number': None,
+            'receiver_type': None,
+            'receiver_version': None,
+            'antenna_number': None,
         }
         
-        # Iterate through lines until we reach "END OF HEADER"
-        for line in lines:
-            # RINEX headers are 60 chars of data + 20 chars of label = 80 chars total
-            if len(line) < 60:
-                continue
-                
-            # Extract the label (last 20 characters, typically)
-            label = line[60:].strip()
-            content = line[:60].strip()
-            
-            # Check for end of header
-            if "END OF HEADER" in label:
+        # Collect the header lines only - the observation data can be huge
+        # If there's no "END OF HEADER" the observation scan starts from the top
+        header_lines = []
+        header_end = 0
+        for line in iter(stream.readline, b""):  # readline works for mmap too
+            if line.startswith(LABEL_END_OF_HEADER, 60):
+                header_end = stream.tell()
                 break
-            
-            # Parse different header fields based on their label
-            
-            # 1. RINEX VERSION - tells us format version
-            if "RINEX VERSION" in label:
-                parts = content.split()
-                if len(parts) >= 2:
-                    data['version'] = parts[0]
-                    data['file_type'] = parts[1]
-                    # For RINEX 3+, satellite system is in the version line
-                    if len(parts) >= 3:
-                        data['satellite_system'] = parts[2]
-            
-            # MARKER NAME - Station/point identifier (CRITICAL for surveys)
-            elif "MARKER NAME" in label:
-                data['marker_name'] = content
-            
-            # MARKER NUMBER - Official survey marker number
-            elif "MARKER NUMBER" in label:
-                data['marker_number'] = content
-            
-            # MARKER TYPE - Type of monument/marker
-            elif "MARKER TYPE" in label:
-                data['marker_type'] = content
-            
-            # OBSERVER / AGENCY - Who collected the data
-            elif "OBSERVER / AGENCY" in label:
-                # Format is usually: OBSERVER          AGENCY
-                parts = content.split()
-                if len(parts) >= 1:
-                    data['observer'] = parts[0]
-                if len(parts) >= 2:
-                    data['agency'] = ' '.join(parts[1:])  # Agency may be multiple words
-            
-            # RECEIVER INFO - Type, serial number, firmware version
-            elif "REC # / TYPE / VERS" in label:
-                # Format: SERIAL# TYPE VERSION
-                parts = content.split()
-                if len(parts) >= 1:
-                    data['receiver_number'] = parts[0]
-                if len(parts) >= 2:
-                    data['receiver_type'] = parts[1]
-                if len(parts) >= 3:
-                    data['receiver_version'] = parts[2]
-            
-            # 2. ANTENNA TYPE - make and model
-            elif "ANT # / TYPE" in label or "ANTENNA TYPE" in label:
-                # Format: SERIAL# TYPE or just TYPE
-                parts = content.split()
-                if len(parts) >= 1:
-                    # Check if first part is a serial number or antenna type
-                    if len(parts) >= 2 and not parts[0].isalpha():
-                        data['antenna_number'] = parts[0]
-                        data['antenna_type'] = ' '.join(parts[1:])
-                    else:
-                        data['antenna_type'] = content
-            
-            # 3. ANTENNA HEIGHT - height above ground
-            elif "ANTENNA: DELTA H/E/N" in label or "ANTENNA DELTA" in label:
-                parts = content.split()
-                if len(parts) >= 1:
-                    data['antenna_height'] = parts[0]  # First value is height
-                if len(parts) >= 3:
-                    data['antenna_delta'] = f"H:{parts[0]} E:{parts[1]} N:{parts[2]}"
-            
-            # 4. APPROXIMATE POSITION - XYZ coordinates in meters
-            elif "APPROX POSITION XYZ" in label:
-                data['approx_position'] = content
-                # Try to convert XYZ to Lat/Lon/Elev
-                try:
-                    coords = [float(x) for x in content.split()]
-                    if len(coords) == 3:
-                        lat, lon, elev = self.xyz_to_latlon(coords[0], coords[1], coords[2])
-                        data['lat_lon_elev'] = f"Lat: {lat:.8f}°, Lon: {lon:.8f}°, Elev: {elev:.3f}m"
-                except:
-                    pass
-            
-            # 5. OBSERVATION INTERVAL - epoch rate in seconds
-            elif "INTERVAL" in label:
-                data['interval'] = content
-            
-            # 6. TIME OF FIRST OBS - start time of observations
-            elif "TIME OF FIRST OBS" in label:
-                data['time_first_obs'] = content
-            
-            # 7. TIME OF LAST OBS - end time of observations
-            elif "TIME OF LAST OBS" in label:
-                data['time_last_obs'] = content
-            
-            # 8. LEAP SECONDS - GPS/UTC time offset
-            elif "LEAP SECONDS" in label:
-                data['leap_seconds'] = content
-            
-            # 9. SYS / # / OBS TYPES - observation types per satellite system (RINEX 3+)
-            elif "SYS / # / OBS TYPES" in label:
-                parts = content.split()
-                if len(parts) >= 2:
-                    # Check if this is a continuation line (starts with spaces, no system code)
-                    # Continuation lines don't have a letter in the first position
-                    if parts[0][0].isalpha() and len(parts[0]) == 1:
-                        # This is a new system line
-                        sys = parts[0]  # Satellite system (G=GPS, R=GLONASS, E=Galileo, etc.)
-                        try:
-                            num_obs = int(parts[1])
-                            obs_types = parts[2:]
-                            data['observation_types'][sys] = obs_types
-                            data['constellations_obs'].add(sys)
-                            # Store the last system for continuation lines
-                            data['_last_obs_system'] = sys
-                        except ValueError:
-                            # Not a valid number, skip this line
-                            pass
-                    elif '_last_obs_system' in data:
-                        # This is a continuation line - append to the last system
-                        sys = data['_last_obs_system']
-                        if sys in data['observation_types']:
-                            data['observation_types'][sys].extend(parts)
-            
-            # 10. # / TYPES OF OBSERV - observation types (RINEX 2.x)
-            elif "TYPES OF OBSERV" in label:
-                parts = content.split()
-                if len(parts) >= 1:
-                    try:
-                        num_obs = int(parts[0])
-                        obs_types = parts[1:1+num_obs]
-                        # In RINEX 2, observations apply to all systems
-                        data['observation_types']['ALL'] = obs_types
-                    except ValueError:
-                        # Not a valid number, skip this line
-                        pass
+            header_lines.append(line)
+        header_bytes = b"".join(header_lines)
+        
+        # One regex pass finds every label we care about, then we jump straight to its handler
+        for match in self.HEADER_RE.finditer(header_bytes):
+            content = match.group(1).strip().decode('utf-8', errors='ignore')
+            self.HEADER_HANDLERS[match.group(2)](self, data, content, content.split())
         
         # Clean up temporary variables used during parsing
         if '_last_obs_system' in data:
             del data['_last_obs_system']
         
-        return data
+        return data, header_end
+    
+    # Header field handlers - each one receives the 60-char data part of a header line
+    # (already stripped) plus its whitespace-separated parts, and stores what it
+    # finds in the header dictionary.
+    
+    def _h_version(self, data, content, parts):
+        # 1. RINEX VERSION - tells us format version
+        if len(parts) >= 2:
+            data['version'] = parts[0]
+            data['file_type'] = parts[1]
+            # For RINEX 3+, satellite system is in the version line
+            if len(parts) >= 3:
+                data['satellite_system'] = parts[2]
+    
+    def _h_marker_name(self, data, content, parts):
+        # MARKER NAME - Station/point identifier (CRITICAL for surveys)
+        data['marker_name'] = content
+    
+    def _h_marker_number(self, data, content, parts):
+        # MARKER NUMBER - Official survey marker number
+        data['marker_number'] = content
+    
+    def _h_marker_type(self, data, content, parts):
+        # MARKER TYPE - Type of monument/marker
+        data['marker_type'] = content
+    
+    def _h_observer_agency(self, data, content, parts):
+        # OBSERVER / AGENCY - Who collected the data
+        # Format is usually: OBSERVER          AGENCY
+        if len(parts) >= 1:
+            data['observer'] = parts[0]
+        if len(parts) >= 2:
+            data['agency'] = ' '.join(parts[1:])  # Agency may be multiple words
+    
+    def _h_receiver(self, data, content, parts):
+        # RECEIVER INFO - Type, serial number, firmware version
+        # Format: SERIAL# TYPE VERSION
+        if len(parts) >= 1:
+            data['receiver_number'] = parts[0]
+        if len(parts) >= 2:
+            data['receiver_type'] = parts[1]
+        if len(parts) >= 3:
+            data['receiver_version'] = parts[2]
+    
+    def _h_antenna_type(self, data, content, parts):
+        # 2. ANTENNA TYPE - make and model
+        # Format: SERIAL# TYPE or just TYPE
+        if len(parts) >= 1:
+            # Check if first part is a serial number or antenna type
+            if len(parts) >= 2 and not parts[0].isalpha():
+                data['antenna_number'] = parts[0]
+                data['antenna_type'] = ' '.join(parts[1:])
+            else:
+                data['antenna_type'] = content
+    
+    def _h_antenna_delta(self, data, content, parts):
+        # 3. ANTENNA HEIGHT - height above ground
+        if len(parts) >= 1:
+            data['antenna_height'] = parts[0]  # First value is height
+        if len(parts) >= 3:
+            data['antenna_delta'] = f"H:{parts[0]} E:{parts[1]} N:{parts[2]}"
+    
+    def _h_approx_position(self, data, content, parts):
+        # 4. APPROXIMATE POSITION - XYZ coordinates in meters
+        data['approx_position'] = content
+        # Try to convert XYZ to Lat/Lon/Elev
+        try:
+            # One C-level conversion for all three fields instead of a float() per value
+            coords = np.asarray(parts, dtype=np.float64)
+            if coords.size == 3:
+                lat, lon, elev = self.xyz_to_latlon(coords[0], coords[1], coords[2])
+                data['lat_lon_elev'] = f"Lat: {lat:.8f}°, Lon: {lon:.8f}°, Elev: {elev:.3f}m"
+        except:
+            pass
+    
+    def _h_interval(self, data, content, parts):
+        # 5. OBSERVATION INTERVAL - epoch rate in seconds
+        data['interval'] = content
     
-    def parse_observation_data(self, lines, header_data):
+    def _h_time_first_obs(self, data, content, parts):
+        # 6. TIME OF FIRST OBS - start time of observations
+        data['time_first_obs'] = content
+    
+    def _h_time_last_obs(self, data, content, parts):
+        # 7. TIME OF LAST OBS - end time of observations
+        data['time_last_obs'] = content
+    
+    def _h_leap_seconds(self, data, content, parts):
+        # 8. LEAP SECONDS - GPS/UTC time offset
+        data['leap_seconds'] = content
+    
+    def _h_sys_obs_types(self, data, content, parts):
+        # 9. SYS / # / OBS TYPES - observation types per satellite system (RINEX 3+)
+        if len(parts) >= 2:
+            # Check if this is a continuation line (starts with spaces, no system code)
+            # Continuation lines don't have a letter in the first position
+            if parts[0][0].isalpha() and len(parts[0]) == 1:
+                # This is a new system line
+                sys = parts[0]  # Satellite system (G=GPS, R=GLONASS, E=Galileo, etc.)
+                try:
+                    num_obs = int(parts[1])
+                    obs_types = parts[2:]
+                    data['observation_types'][sys] = obs_types
+                    data['constellations_obs'].add(sys)
+                    # Store the last system for continuation lines
+                    data['_last_obs_system'] = sys
+                except ValueError:
+                    # Not a valid number, skip this line
+                    pass
+            elif '_last_obs_system' in data:
+                # This is a continuation line - append to the last system
+                sys = data['_last_obs_system']
+                if sys in data['observation_types']:
+                    data['observation_types'][sys].extend(parts)
+    
+    def _h_types_of_observ(self, data, content, parts):
+        # 10. # / TYPES OF OBSERV - observation types (RINEX 2.x)
+        if len(parts) >= 1:
+            try:
+                num_obs = int(parts[0])
+                obs_types = parts[1:1+num_obs]
+                # In RINEX 2, observations apply to all systems
+                data['observation_types']['ALL'] = obs_types
+            except ValueError:
+                # Not a valid number, skip this line
+                pass
+    
+    # Maps each header label to the handler that parses it
+    HEADER_HANDLERS = {
+        LABEL_VERSION: _h_version,
+        LABEL_MARKER_NAME: _h_marker_name,
+        LABEL_MARKER_NUMBER: _h_marker_number,
+        LABEL_MARKER_TYPE: _h_marker_type,
+        LABEL_OBSERVER_AGENCY: _h_observer_agency,
+        LABEL_RECEIVER: _h_receiver,
+        LABEL_ANTENNA: _h_antenna_type,
+        LABEL_ANTENNA_OLD: _h_antenna_type,
+        LABEL_ANTENNA_DELTA: _h_antenna_delta,
+        LABEL_ANTENNA_DELTA_OLD: _h_antenna_delta,
+        LABEL_APPROX_POSITION: _h_approx_position,
+        LABEL_INTERVAL: _h_interval,
+        LABEL_TIME_FIRST_OBS: _h_time_first_obs,
+        LABEL_TIME_LAST_OBS: _h_time_last_obs,
+        LABEL_LEAP_SECONDS: _h_leap_seconds,
+        LABEL_SYS_OBS_TYPES: _h_sys_obs_types,
+        LABEL_TYPES_OF_OBSERV: _h_types_of_observ,
+    }
+    
+    # Matches any label in HEADER_HANDLERS, anchored at column 60 of each line.
+    # Built from the table so a new label only has to be added in one place.
+    HEADER_RE = re.compile(
+        rb"(?m)^(.{60})(" + b"|".join(re.escape(label) for label in HEADER_HANDLERS) + rb")"
+    )
+    
+    def parse_observation_data(self, stream, header_data, header_end, header_only=False):
         """
         Parse the observation data section to find satellite constellations,
         and calculate actual start/end times and duration.
         
-        lines: All lines from the RINEX file
-        header_data: Dictionary with header information (to know when header ends)
+        stream: Binary file object containing the RINEX file
+        header_data: Dictionary with header information
+        header_end: Byte offset of the first observation record (from parse_rinex_header)
+        header_only: Skip the observation records and return empty statistics
         Returns: Dictionary with observation statistics
         """
         
@@ -640,29 +1052,80 @@ COMPRESSION SUPPORT STATUS
             'duration_seconds': 0,
             'num_epochs': 0,
             'calculated_interval': None,
-            'epoch_times': [],  # Store epoch times for interval calculation
+            'epoch_times': None,  # int64 array of epoch times (microseconds since UNIX_EPOCH)
             'satellites_per_epoch': [],  # Store satellite counts for quality metrics
+            'header_only': header_only,
         }
         
-        # Find where header ends
-        header_end = 0
-        for i, line in enumerate(lines):
-            if "END OF HEADER" in line:
-                header_end = i + 1
-                break
+        # User asked for the header only - don't touch the observation records
+        if header_only:
+            return data
         
         # Process observation records
+        stream.seek(header_end)
+        if NUMBA_AVAILABLE:
+            # Fast path - compiled scanner over the raw bytes
+            epoch_times, epoch_count = self.scan_observations_compiled(stream, data)
+        else:
+            epoch_times, epoch_count = self.scan_observations_python(stream, data)
+        data['epoch_times'] = epoch_times
+        
+        # Calculate duration and format times
+        if len(epoch_times):
+            first_epoch_time = UNIX_EPOCH + timedelta(microseconds=int(epoch_times[0]))
+            last_epoch_time = UNIX_EPOCH + timedelta(microseconds=int(epoch_times[-1]))
+            data['actual_start'] = first_epoch_time.strftime("%Y-%m-%d %H:%M:%S")
+            data['actual_end'] = last_epoch_time.strftime("%Y-%m-%d %H:%M:%S")
+            data['duration_seconds'] = int(epoch_times[-1] - epoch_times[0]) / 1_000_000
+            data['num_epochs'] = epoch_count
+        
+        # Calculate actual observation interval from consecutive epochs
+        if len(epoch_times) >= 2:
+            # Intervals between all consecutive epochs, in microseconds
+            intervals = np.diff(epoch_times)
+            # Only include positive, reasonable intervals (0.001s to 3600s)
+            # This filters out potential parsing errors or time resets
+            intervals = intervals[(intervals >= 1_000) & (intervals <= 3_600_000_000)]
+            
+            if intervals.size:
+                # Calculate statistics (in seconds)
+                min_interval = intervals.min() / 1_000_000
+                max_interval = intervals.max() / 1_000_000
+                avg_interval = intervals.mean() / 1_000_000
+                
+                # Check if intervals are consistent (within 1% tolerance)
+                if max_interval - min_interval < 0.01 * avg_interval:
+                    # Consistent interval - report as single value
+                    data['calculated_interval'] = f"{avg_interval:.3f}"
+                    data['interval_consistent'] = True
+                else:
+                    # Variable interval - report range and average
+                    data['calculated_interval'] = f"{avg_interval:.3f} (range: {min_interval:.3f}-{max_interval:.3f})"
+                    data['interval_consistent'] = False
+        
+        return data
+    
+    def scan_observations_python(self, stream, data):
+        """
+        Walk the observation records line by line in plain Python.
+        Fills data['constellations_in_data'].
+        
+        Returns: (epoch_times, epoch_count) - epoch_times is an int64 array of
+                 microseconds since UNIX_EPOCH
+        """
+        
         in_epoch = False
-        first_epoch_time = None
-        last_epoch_time = None
+        epoch_times = np.empty(EPOCH_ARRAY_START, dtype=np.int64)
+        num_times = 0
         epoch_count = 0
+        const_mask = 0    # Bit (code - ord('A')) set for each satellite system seen
         
-        for line in lines[header_end:]:
+        for line in iter(stream.readline, b""):
             # In RINEX 3.x, epoch lines start with '>'
             # In RINEX 2.x, epoch lines have year/month/day in first few columns
             
             # RINEX 3.x epoch detection
-            if line.startswith('>'):
+            if line[:1] == b'>':
                 in_epoch = True
                 epoch_count += 1
                 
@@ -676,22 +1139,23 @@ COMPRESSION SUPPORT STATUS
                         hour = int(parts[4])
                         minute = int(parts[5])
                         second = float(parts[6])
-                        usec = int(round((second - int(second)) * 1_000_000))
+                        second_us = int(second) * 1_000_000 + int(round((second - int(second)) * 1_000_000))
                         
-                        epoch_time = datetime(year, month, day, hour, minute, int(second), usec)
-
-                        # Store epoch times for interval calculation (limit to first 100 to save memory)
-                        if len(data['epoch_times']) < 100:
-                            data['epoch_times'].append(epoch_time)
+                        epoch_time = _epoch_us(year, month, day, hour, minute, second_us)
                         
-                        if first_epoch_time is None:
-                            first_epoch_time = epoch_time
-                        last_epoch_time = epoch_time
+                        # Store epoch times for interval calculation
+                        if epoch_time != -1:
+                            if num_times == len(epoch_times):
+                                epoch_times = np.resize(epoch_times, 2 * num_times)
+                            epoch_times[num_times] = epoch_time
+                            num_times += 1
                 except:
                     pass
                     
-            # RINEX 2.x epoch detection (starts with space and year in columns 1-3)
-            elif len(line) > 29 and line[0] == ' ' and line[1:3].strip().isdigit():
+            # RINEX 2.x epoch detection (starts with space and two-digit year in columns 1-3)
+            # Compares single bytes as integers (0x20 = space, 0x30-0x39 = digits)
+            elif (len(line) > 29 and line[0] == 0x20
+                  and 0x30 <= line[1] <= 0x39 and 0x30 <= line[2] <= 0x39):
                 try:
                     # RINEX 2.x format: YY MM DD HH MM SS.SSSSSSS
                     year = int(line[1:3])
@@ -702,19 +1166,18 @@ COMPRESSION SUPPORT STATUS
                     hour = int(line[10:12])
                     minute = int(line[13:15])
                     second = float(line[16:26])
-                    usec = int(round((second - int(second)) * 1_000_000))
-                                        
-                    epoch_time = datetime(year, month, day, hour, minute, int(second), usec)
-                    epoch_count += 1
-                    
-                    # Store epoch times for interval calculation (limit to first 100 to save memory)
-                    if len(data['epoch_times']) < 100:
-                        data['epoch_times'].append(epoch_time)
+                    second_us = int(second) * 1_000_000 + int(round((second - int(second)) * 1_000_000))
                     
-                    if first_epoch_time is None:
-                        first_epoch_time = epoch_time
-                    last_epoch_time = epoch_time
-                    in_epoch = True
+                    epoch_time = _epoch_us(year, month, day, hour, minute, second_us)
+                    if epoch_time != -1:
+                        epoch_count += 1
+                        
+                        # Store epoch times for interval calculation
+                        if num_times == len(epoch_times):
+                            epoch_times = np.resize(epoch_times, 2 * num_times)
+                        epoch_times[num_times] = epoch_time
+                        num_times += 1
+                        in_epoch = True
                 except:
                     pass
             
@@ -724,302 +1187,320 @@ COMPRESSION SUPPORT STATUS
             elif in_epoch and len(line) > 3:
                 # Try RINEX 3.x format (system letter + number)
                 sat_id = line[0:3].strip()
-                if len(sat_id) >= 2 and sat_id[0].isalpha():
-                    system = sat_id[0]
-                    data['constellations_in_data'].add(system)
+                if len(sat_id) >= 2:
+                    c = sat_id[0]
+                    if 0x41 <= c <= 0x5A or 0x61 <= c <= 0x7A:
+                        const_mask |= 1 << (c - 65)
         
-        # Calculate duration and format times
-        if first_epoch_time and last_epoch_time:
-            data['actual_start'] = first_epoch_time.strftime("%Y-%m-%d %H:%M:%S")
-            data['actual_end'] = last_epoch_time.strftime("%Y-%m-%d %H:%M:%S")
-            duration = (last_epoch_time - first_epoch_time).total_seconds()
-            data['duration_seconds'] = duration
-            data['num_epochs'] = epoch_count
+        data['constellations_in_data'] = {chr(65 + bit) for bit in range(64) if const_mask & (1 << bit)}
         
-        # Calculate actual observation interval from consecutive epochs
-        if len(data['epoch_times']) >= 2:
-            # Calculate intervals between all consecutive epochs
-            intervals = []
-            for i in range(len(data['epoch_times']) - 1):
-                interval = (data['epoch_times'][i + 1] - data['epoch_times'][i]).total_seconds()
-                # Only include positive, reasonable intervals (0.001s to 3600s)
-                # This filters out potential parsing errors or time resets
-                if 0.001 <= interval <= 3600:
-                    intervals.append(interval)
-            
-            if intervals:
-                # Calculate statistics
-                min_interval = min(intervals)
-                max_interval = max(intervals)
-                avg_interval = sum(intervals) / len(intervals)
-                
-                # Check if intervals are consistent (within 1% tolerance)
-                if max_interval - min_interval < 0.01 * avg_interval:
-                    # Consistent interval - report as single value
-                    data['calculated_interval'] = f"{avg_interval:.3f}"
-                    data['interval_consistent'] = True
-                else:
-                    # Variable interval - report range and average
-                    data['calculated_interval'] = f"{avg_interval:.3f} (range: {min_interval:.3f}-{max_interval:.3f})"
-                    data['interval_consistent'] = False
+        return epoch_times[:num_times], epoch_count
+    
+    def scan_observations_compiled(self, stream, data):
+        """
+        Feed the observation records through the numba-compiled _scan_observations
+        kernel in blocks, so no Python objects are created per line.
+        Fills data['constellations_in_data'].
         
-        return data
+        Returns: (epoch_times, epoch_count) - epoch_times is an int64 array of
+                 microseconds since UNIX_EPOCH
+        """
+        state = np.zeros(SCAN_STATE_SIZE, dtype=np.int64)
+        epoch_times = np.empty(EPOCH_ARRAY_START, dtype=np.int64)
+        
+        if isinstance(stream, mmap.mmap):
+            # Mapped file - hand the kernel newline-aligned slices of the mapping
+            # itself, no bytes are copied
+            buf = np.frombuffer(stream, dtype=np.uint8)
+            try:
+                start = stream.tell()
+                end = len(stream)
+                while start < end:
+                    cut = start + READ_BUFFER_SIZE
+                    if cut < end:
+                        cut = stream.rfind(b"\n", start, cut) + 1
+                        if cut <= start:
+                            # Line longer than a block - extend to its end
+                            cut = stream.find(b"\n", start + READ_BUFFER_SIZE) + 1 or end
+                    else:
+                        cut = end
+                    epoch_times = self.reserve_epoch_times(epoch_times, state, cut - start)
+                    _scan_observations(buf[start:cut], state, epoch_times)
+                    start = cut
+            except BaseException as e:
+                # Frames in the traceback (e.g. numba compiling the kernel) may hold
+                # a slice of the view - clear them so the mapping can still be closed
+                traceback.clear_frames(e.__traceback__)
+                raise
+            finally:
+                # The mapping can't be closed while numpy still holds a view of it,
+                # so drop the view even when the scan fails
+                del buf
+        else:
+            # The kernel only sees whole lines - a partial line at the end of a block
+            # is carried over to the next one
+            tail = b""
+            while True:
+                block = stream.read(READ_BUFFER_SIZE)
+                if not block:
+                    break
+                block = tail + block
+                cut = block.rfind(b"\n") + 1
+                tail = block[cut:]
+                if cut:
+                    epoch_times = self.reserve_epoch_times(epoch_times, state, cut)
+                    _scan_observations(np.frombuffer(block, dtype=np.uint8, count=cut), state, epoch_times)
+            if tail:
+                epoch_times = self.reserve_epoch_times(epoch_times, state, len(tail))
+                _scan_observations(np.frombuffer(tail, dtype=np.uint8), state, epoch_times)
+        
+        mask = int(state[SCAN_CONST_MASK])
+        data['constellations_in_data'] = {chr(65 + bit) for bit in range(64) if mask & (1 << bit)}
+        
+        return epoch_times[:state[SCAN_NUM_TIMES]], int(state[SCAN_EPOCH_COUNT])
+    
+    def reserve_epoch_times(self, epoch_times, state, block_size):
+        """
+        Make sure the epoch time array has room for every epoch a block of
+        block_size bytes could hold, doubling its size as needed.
+        """
+        needed = int(state[SCAN_NUM_TIMES]) + block_size // MIN_EPOCH_LINE + 1
+        size = len(epoch_times)
+        if needed <= size:
+            return epoch_times
+        while size < needed:
+            size *= 2
+        return np.resize(epoch_times, size)
     
     def xyz_to_latlon(self, x, y, z):
         """
         Convert ECEF (Earth-Centered Earth-Fixed) XYZ coordinates to Lat/Lon/Elevation.
-        Uses WGS84 ellipsoid parameters.
+        Uses WGS84 ellipsoid parameters (see ecef_to_geodetic).
         
         x, y, z: Coordinates in meters
         Returns: (latitude, longitude, elevation) in degrees and meters
         """
-        
-        # WGS84 ellipsoid parameters
-        a = 6378137.0  # Semi-major axis in meters
-        f = 1/298.257223563  # Flattening
-        e2 = 2*f - f*f  # Square of eccentricity
-        
-        # Calculate longitude (easy part)
-        lon = math.atan2(y, x) * 180.0 / math.pi
-        
-        # Calculate latitude and elevation (iterative process)
-        p = math.sqrt(x*x + y*y)
-        lat = math.atan2(z, p * (1 - e2))
-        
-        # Iterate to refine latitude
-        for _ in range(5):
-            sin_lat = math.sin(lat)
-            N = a / math.sqrt(1 - e2 * sin_lat * sin_lat)
-            lat = math.atan2(z + e2 * N * sin_lat, p)
-        
-        # Calculate elevation
-        sin_lat = math.sin(lat)
-        N = a / math.sqrt(1 - e2 * sin_lat * sin_lat)
-        elev = p / math.cos(lat) - N
-        
-        # Convert latitude to degrees
-        lat = lat * 180.0 / math.pi
-        
-        return lat, lon, elev
+        return ecef_to_geodetic(x, y, z)
     
-    def display_results(self, data, filepath):
+    def display_results(self, data, filepath, file_type):
         """
         Display all extracted information in the text widget.
         Formats the data nicely for easy reading.
         
         data: Dictionary containing all extracted RINEX information
-        filepath: Path to the original file (to show compression info)
+        filepath: Path to the original file
+        file_type: (is_compressed, compression_type, needs_hatanaka) from detect_file_type
         """
         
-        # Clear previous results
-        self.results_text.delete(1.0, tk.END)
-        
-        # Build output string with formatted information
-        output = "=" * 80 + "\n"
-        output += "RINEX FILE INFORMATION\n"
-        output += "=" * 80 + "\n\n"
-        
-        # Show file info
-        output += f"File: {os.path.basename(filepath)}\n"
-        is_compressed, comp_type, needs_hatanaka = self.detect_file_type(filepath)
+        # Build the report as a list of sections, handed to the panel as is.
+        # Each section (or each branch of a conditional one) is a single f-string -
+        # adjacent literals are merged by the compiler, so it is one append apiece.
+        is_compressed, comp_type, needs_hatanaka = file_type
+        parts = [f"{BANNER_FILE_INFO}File: {os.path.basename(filepath)}\n"]
         if is_compressed:
-            output += f"Compression: {comp_type}\n"
-        output += "\n"
+            parts.append(f"Compression: {comp_type}\n")
         
         # SURVEY METADATA - Critical for surveyors/geospatial analysts
-        output += "=" * 80 + "\n"
-        output += "SURVEY METADATA\n"
-        output += "=" * 80 + "\n"
-        if data['marker_name'] != 'Unknown':
-            output += f"Marker Name:    {data['marker_name']}\n"
-        if data['marker_number'] != 'Unknown':
-            output += f"Marker Number:  {data['marker_number']}\n"
-        if data['marker_type'] != 'Unknown':
-            output += f"Marker Type:    {data['marker_type']}\n"
-        if data['observer'] != 'Unknown':
-            output += f"Observer:       {data['observer']}\n"
-        if data['agency'] != 'Unknown':
-            output += f"Agency:         {data['agency']}\n"
-        if data['receiver_type'] != 'Unknown':
-            output += f"Receiver:       {data['receiver_type']}"
-            if data['receiver_version'] != 'Unknown':
-                output += f" (v{data['receiver_version']})"
-            if data['receiver_number'] != 'Unknown':
-                output += f" S/N: {data['receiver_number']}"
-            output += "\n"
-        if data['antenna_number'] != 'Unknown':
-            output += f"Antenna S/N:    {data['antenna_number']}\n"
+        parts.append(f"\n{BANNER_SURVEY}")
+        if data['marker_name'] is not None:
+            parts.append(f"Marker Name:    {data['marker_name']}\n")
+        if data['marker_number'] is not None:
+            parts.append(f"Marker Number:  {data['marker_number']}\n")
+        if data['marker_type'] is not None:
+            parts.append(f"Marker Type:    {data['marker_type']}\n")
+        if data['observer'] is not None:
+            parts.append(f"Observer:       {data['observer']}\n")
+        if data['agency'] is not None:
+            parts.append(f"Agency:         {data['agency']}\n")
+        if data['receiver_type'] is not None:
+            version = f" (v{data['receiver_version']})" if data['receiver_version'] is not None else ""
+            serial = f" S/N: {data['receiver_number']}" if data['receiver_number'] is not None else ""
+            parts.append(f"Receiver:       {data['receiver_type']}{version}{serial}\n")
+        if data['antenna_number'] is not None:
+            parts.append(f"Antenna S/N:    {data['antenna_number']}\n")
         
         # Only show section if at least one field was populated
-        if (data['marker_name'] == 'Unknown' and data['marker_number'] == 'Unknown' and 
-            data['observer'] == 'Unknown' and data['receiver_type'] == 'Unknown'):
-            output += "⚠ No survey metadata found in header\n"
-        
-        output += "\n"
+        if (data['marker_name'] is None and data['marker_number'] is None and 
+            data['observer'] is None and data['receiver_type'] is None):
+            parts.append("⚠ No survey metadata found in header\n")
         
         # 1. RINEX Version
-        output += f"1. RINEX VERSION:\n"
-        output += f"   {data['version']} ({data['file_type']})\n\n"
+        parts.append(
+            "\n"
+            "1. RINEX VERSION:\n"
+            f"   {data['version']} ({data['file_type']})\n\n"
+            "2. SATELLITE CONSTELLATIONS:\n"
+        )
         
         # 2. Satellite Constellations
-        output += f"2. SATELLITE CONSTELLATIONS:\n"
-        
         # Observation constellations (from header)
         if data['constellations_obs']:
             const_names = self.get_constellation_names(data['constellations_obs'])
-            output += f"   Observation types defined for: {', '.join(const_names)}\n"
+            parts.append(f"   Observation types defined for: {', '.join(const_names)}\n")
         
         # Constellations in actual data
-        if data['constellations_in_data']:
-            const_names = self.get_constellation_names(data['constellations_in_data'])
-            output += f"   Satellites observed in data: {', '.join(const_names)}\n"
+        consts = data['constellations_in_data']
+        if consts:
+            # Kept for the data quality section, which lists the same systems
+            data_const_names = ', '.join(self.get_constellation_names(consts))
+            parts.append(f"   Satellites observed in data: {data_const_names}\n")
         
         # Ephemerides (if NAV file, would be listed separately - this is obs file)
         
-        output += f"   Note: This appears to be an observation file.\n"
-        output += f"         Ephemeris data would be in a separate navigation file.\n\n"
-        
-        # 3. Epoch / Observation Rate
-        output += f"3. OBSERVATION INTERVAL (EPOCH RATE):\n"
-        
-        # Show header value
+        # 3. Epoch / Observation Rate - header value first
         header_interval = data['interval']
-        output += f"   Header value:     {header_interval} seconds\n"
+        parts.append(
+            "   Note: This appears to be an observation file.\n"
+            "         Ephemeris data would be in a separate navigation file.\n\n"
+            "3. OBSERVATION INTERVAL (EPOCH RATE):\n"
+            f"   Header value:     {header_interval} seconds\n"
+        )
         
         # Show calculated value if available
-        if data.get('calculated_interval'):
-            output += f"   Calculated value: {data['calculated_interval']} seconds\n"
+        calc_interval = data.get('calculated_interval')
+        if calc_interval:
+            parts.append(f"   Calculated value: {calc_interval} seconds\n")
             
             # Check for discrepancies between header and calculated
             if header_interval != 'Unknown':
                 try:
                     header_float = float(header_interval)
-                    calc_float = float(data['calculated_interval'].split()[0])  # Get just the number
+                    calc_float = float(calc_interval.split()[0])  # Get just the number
                     
                     # Allow 1% tolerance for rounding differences
                     if abs(header_float - calc_float) > 0.01 * header_float:
-                        output += f"   ⚠ WARNING: Header and calculated intervals don't match!\n"
+                        parts.append("   ⚠ WARNING: Header and calculated intervals don't match!\n")
                 except:
                     pass
             
             # Flag variable intervals
             if not data.get('interval_consistent', True):
-                output += f"   ⚠ NOTE: Observation interval is NOT consistent (varies between epochs)\n"
+                parts.append("   ⚠ NOTE: Observation interval is NOT consistent (varies between epochs)\n")
         elif header_interval == 'Unknown':
-            output += f"   ⚠ No interval found in header and could not calculate from data\n"
-        
-        output += "\n"
+            parts.append("   ⚠ No interval found in header and could not calculate from data\n")
         
         # 4. Observation Duration
-        output += f"4. OBSERVATION DURATION:\n"
-        if data['actual_start']:
-            output += f"   Start Time:  {data['actual_start']}\n"
-            output += f"   End Time:    {data['actual_end']}\n"
-            output += f"   Duration:    {data['duration_seconds']:.1f} seconds "
-            output += f"({data['duration_seconds']/3600:.2f} hours)\n"
-            output += f"   Epochs:      {data['num_epochs']}\n"
+        # Fields used in the sections below are looked up once into locals
+        start = data['actual_start']
+        n_epochs = data['num_epochs']
+        if start:
+            dur = data['duration_seconds']
+            parts.append(
+                "\n"
+                "4. OBSERVATION DURATION:\n"
+                f"   Start Time:  {start}\n"
+                f"   End Time:    {data['actual_end']}\n"
+                f"   Duration:    {dur:.1f} seconds "
+                f"({dur/3600:.2f} hours)\n"
+                f"   Epochs:      {n_epochs}\n"
+            )
         else:
-            output += f"   From header: {data['time_first_obs']}\n"
-            output += f"   To:          {data['time_last_obs']}\n"
-            output += f"   (Could not parse observation data for exact duration)\n"
-        output += "\n"
-        
-        # 5. Antenna Make/Model
-        output += f"5. ANTENNA MAKE/MODEL:\n"
-        output += f"   {data['antenna_type']}\n\n"
-        
-        # 6. Antenna Height
-        output += f"6. ANTENNA HEIGHT:\n"
-        output += f"   {data['antenna_height']} meters\n"
-        if data['antenna_delta'] != 'Unknown':
-            output += f"   (Full delta H/E/N: {data['antenna_delta']})\n"
-        output += "\n"
+            if data['header_only']:
+                reason = "Header only - observation data was not read"
+            else:
+                reason = "Could not parse observation data for exact duration"
+            parts.append(
+                "\n"
+                "4. OBSERVATION DURATION:\n"
+                f"   From header: {data['time_first_obs']}\n"
+                f"   To:          {data['time_last_obs']}\n"
+                f"   ({reason})\n"
+            )
+        
+        # 5. Antenna Make/Model and 6. Antenna Height
+        ant_delta = data['antenna_delta']
+        if ant_delta is not None:
+            delta = f"   (Full delta H/E/N: {ant_delta})\n"
+        else:
+            delta = ""
+        parts.append(
+            "\n"
+            "5. ANTENNA MAKE/MODEL:\n"
+            f"   {data['antenna_type']}\n\n"
+            "6. ANTENNA HEIGHT:\n"
+            f"   {data['antenna_height']} meters\n"
+            f"{delta}\n"
+        )
         
         # 7. Antenna Position (Lat/Lon/Elev)
-        output += f"7. ANTENNA POSITION:\n"
-        output += f"   Approximate XYZ: {data['approx_position']}\n"
-        output += f"   Converted:       {data['lat_lon_elev']}\n\n"
+        parts.append(
+            "7. ANTENNA POSITION:\n"
+            f"   Approximate XYZ: {data['approx_position']}\n"
+            f"   Converted:       {data['lat_lon_elev']}\n\n"
+        )
         
         # Additional useful information
-        output += "=" * 80 + "\n"
-        output += "DATA QUALITY INDICATORS\n"
-        output += "=" * 80 + "\n\n"
+        parts.append(BANNER_QUALITY)
         
         # Total epochs and satellites
-        if data['num_epochs'] > 0:
-            output += f"Total Epochs:      {data['num_epochs']}\n"
+        if n_epochs > 0:
+            parts.append(f"Total Epochs:      {n_epochs}\n")
             
         # Unique satellites observed
-        if data['constellations_in_data']:
-            const_list = list(data['constellations_in_data'])
-            output += f"GNSS Systems:      {len(const_list)} system(s) - {', '.join(self.get_constellation_names(const_list))}\n"
-        
-        output += "\n"
+        if consts:
+            parts.append(f"GNSS Systems:      {len(consts)} system(s) - {data_const_names}\n")
         
         # Additional useful information
-        output += "=" * 80 + "\n"
-        output += "ADDITIONAL INFORMATION\n"
-        output += "=" * 80 + "\n\n"
+        parts.append(f"\n{BANNER_ADDITIONAL}")
         
         # Observation types
-        if data['observation_types']:
-            output += "Observation Types:\n"
-            for sys, obs_types in data['observation_types'].items():
-                sys_name = self.get_system_name(sys)
-                output += f"   {sys_name}: {', '.join(obs_types)}\n"
-            output += "\n"
-        
-        output += f"Satellite System: {data['satellite_system']}\n"
-        output += f"Leap Seconds: {data['leap_seconds']}\n\n"
+        obs_types_by_sys = data['observation_types']
+        if obs_types_by_sys:
+            # One line per system, joined into a single piece
+            rows = "".join(
+                f"   {self.get_system_name(sys)}: {', '.join(obs_types)}\n"
+                for sys, obs_types in obs_types_by_sys.items()
+            )
+            parts.append(f"Observation Types:\n{rows}\n")
         
         # Show compression library status
-        output += "=" * 80 + "\n"
-        output += "COMPRESSION SUPPORT STATUS\n"
-        output += "=" * 80 + "\n"
-        if HATANAKA_AVAILABLE:
-            output += "✓ Hatanaka library installed - CRX files supported\n"
-            output += "  Supported: .crx, .##d, .gz, .Z, .bz2, .zip\n"
-        else:
-            output += "✗ Hatanaka library NOT installed\n"
-            output += "  Limited support: only .gz files (gzip) are supported\n"
-            output += "  To enable CRX support, install: pip install hatanaka\n"
+        parts.append(
+            f"Satellite System: {data['satellite_system']}\n"
+            f"Leap Seconds: {data['leap_seconds']}\n\n"
+            f"{BANNER_COMPRESSION}"
+            f"{COMPRESSION_STATUS}"
+        )
         
-        # Insert the formatted text into the widget
-        self.results_text.insert(tk.END, output)
+        # Insert the sections straight into the widget - no joined copy of the report
+        self.show_results(parts)
+    
+    def show_results(self, chunks):
+        """
+        Replace whatever is in the results panel with the given text chunks.
+        The panel is cleared once and each chunk is appended in turn, so the
+        whole text never has to exist as one Python string.
+        """
+        widget = self.results_text
+        end = tk.END
+        
+        # Turn off wrapping and undo separators while the text goes in - the
+        # lines are wrapped once when wrapping is switched back on
+        widget.config(state='normal', wrap=tk.NONE, autoseparators=False)
+        widget.delete('1.0', end)
+        for chunk in chunks:
+            widget.insert(end, chunk)
+        widget.config(wrap=tk.WORD, autoseparators=True)
+        widget.see('1.0')
+        widget.update_idletasks()
     
     def get_constellation_names(self, system_codes):
         """
         Convert single-letter system codes to full constellation names.
         G = GPS, R = GLONASS, E = Galileo, C = BeiDou, J = QZSS, I = IRNSS, S = SBAS
+        
+        system_codes: Set of system codes
+        Returns: Names in the fixed order of CONSTELLATION_NAMES, then any unknown codes
         """
-        mapping = {
-            'G': 'GPS',
-            'R': 'GLONASS',
-            'E': 'Galileo',
-            'C': 'BeiDou',
-            'J': 'QZSS',
-            'I': 'IRNSS/NavIC',
-            'S': 'SBAS',
-            'ALL': 'All Systems'
-        }
-        return [mapping.get(code, code) for code in sorted(system_codes)]
+        names = [name for code, name in CONSTELLATION_NAMES.items() if code in system_codes]
+        if len(names) < len(system_codes):
+            names.extend(sorted(code for code in system_codes if code not in CONSTELLATION_NAMES))
+        return names
     
     def get_system_name(self, code):
         """
         Get full name for a satellite system code.
         """
-        mapping = {
-            'G': 'GPS',
-            'R': 'GLONASS',
-            'E': 'Galileo',
-            'C': 'BeiDou',
-            'J': 'QZSS',
-            'I': 'IRNSS/NavIC',
-            'S': 'SBAS',
-            'ALL': 'All Systems',
-            'M': 'Mixed'
-        }
-        return mapping.get(code, code)
+        return SYSTEM_NAMES.get(code, code)
 
 
 def main():